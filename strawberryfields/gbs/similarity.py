@@ -39,12 +39,13 @@ Summary
 Code details
 ^^^^^^^^^^^^
 """
+import functools
 from collections import Counter
+from math import factorial
 from typing import Generator, Union
 
 import networkx as nx
 import numpy as np
-from scipy.special import factorial
 
 import strawberryfields as sf
 
@@ -67,6 +68,11 @@ def sample_to_orbit(sample: list) -> list:
     Returns:
         list[int]: the orbit of the sample
     """
+    if isinstance(sample, np.ndarray):
+        # sort in C rather than iterating over NumPy scalars in Python
+        sample = np.sort(sample)[::-1]
+        return sample[: np.count_nonzero(sample)].tolist()
+
     return sorted(filter(None, sample), reverse=True)
 
 
@@ -122,6 +128,8 @@ def orbits(photon_number: int) -> Generator[list, None, None]:
     Returns:
         Generator[list[int]]: orbits with total photon number adding up to ``photon_number``
     """
+    # the algorithm generates partitions with parts in non-decreasing order, so reversing the
+    # slice gives the orbit without having to sort it
     a = [0] * (photon_number + 1)
     k = 1
     y = photon_number - 1
@@ -136,12 +144,12 @@ def orbits(photon_number: int) -> Generator[list, None, None]:
         while x <= y:
             a[k] = x
             a[l] = y
-            yield sorted(a[: k + 2], reverse=True)
+            yield a[l::-1]
             x += 1
             y -= 1
         a[k] = x + y
         y = x + y - 1
-        yield sorted(a[: k + 1], reverse=True)
+        yield a[k::-1]
 
 
 def orbit_to_sample(orbit: list, modes: int) -> list:
@@ -201,18 +209,76 @@ def event_to_sample(photon_number: int, max_count_per_mode: int, modes: int) ->
             "max_count_per_mode or reducing the number of photons."
         )
 
-    sample = [0] * modes
-    available_modes = list(range(modes))
-
-    for _ in range(photon_number):
-        j = np.random.choice(available_modes)
-        sample[j] += 1
-        if sample[j] == max_count_per_mode:
-            available_modes.remove(j)
+    if photon_number == 0:
+        return [0] * modes
+
+    ways = _event_ways(photon_number, max_count_per_mode, modes)
+    compositions = factorial(photon_number + modes - 1) // (
+        factorial(photon_number) * factorial(modes - 1)
+    )
+
+    # Draw a sample uniformly among all ways of placing the photons in the modes using stars and
+    # bars: the positions of the photons ("stars") among photon_number + modes - 1 slots fix the
+    # sample, with the star at sorted position i landing in mode stars[i] - i. Samples exceeding
+    # the maximum count per mode are rejected, so accepted samples are uniform over the event.
+    # Rejection is only used when at least half of the draws are expected to be accepted.
+    if 2 * ways[modes][photon_number] >= compositions:
+        while True:
+            stars = np.sort(
+                np.random.choice(photon_number + modes - 1, photon_number, replace=False)
+            )
+            sample = np.bincount(stars - np.arange(photon_number), minlength=modes)
+            if np.all(sample <= max_count_per_mode):
+                return sample.tolist()
+
+    # The event is too constrained for rejection to be effective. Instead, fill the modes one at a
+    # time, choosing the count of each mode with probability proportional to the number of ways
+    # of distributing the remaining photons over the remaining modes, which is also uniform.
+    sample = []
+    remaining = photon_number
+
+    for j, u in zip(range(modes - 1, -1, -1), np.random.random(modes)):
+        u *= ways[j + 1][remaining]
+        # the last count is always feasible, so it absorbs any floating point round-off
+        for k in range(min(max_count_per_mode, remaining) + 1):
+            u -= ways[j][remaining - k]
+            if u < 0:
+                break
+        sample.append(k)
+        remaining -= k
 
     return sample
 
 
+@functools.lru_cache()
+def _event_ways(photon_number: int, max_count_per_mode: int, modes: int) -> tuple:
+    """Counts the ways of distributing photons over modes with a maximum count per mode.
+
+    Args:
+        photon_number (int): maximum number of photons to distribute
+        max_count_per_mode (int): maximum number of photons per mode
+        modes (int): maximum number of modes
+
+    Returns:
+        tuple[tuple[int]]: element ``[j][r]`` is the number of ways of placing ``r`` photons in
+        ``j`` modes with at most ``max_count_per_mode`` photons per mode
+    """
+    ways = [(1,) + (0,) * photon_number]
+
+    for _ in range(modes):
+        cumulative = [0]
+        for w in ways[-1]:
+            cumulative.append(cumulative[-1] + w)
+        ways.append(
+            tuple(
+                cumulative[r + 1] - cumulative[max(r - max_count_per_mode, 0)]
+                for r in range(photon_number + 1)
+            )
+        )
+
+    return tuple(ways)
+
+
 def orbit_cardinality(orbit: list, modes: int) -> int:
     """Gives the number of samples belonging to the input orbit.
 
@@ -235,8 +301,13 @@ def orbit_cardinality(orbit: list, modes: int) -> int:
         int: number of samples in the orbit
     """
     sample = orbit + [0] * (modes - len(orbit))
-    counts = list(Counter(sample).values())
-    return int(factorial(modes) / np.prod(factorial(counts)))
+
+    # multinomial coefficient evaluated in exact integer arithmetic
+    cardinality = factorial(modes)
+    for c in Counter(sample).values():
+        cardinality //= factorial(c)
+
+    return cardinality
 
 
 def event_cardinality(photon_number: int, max_count_per_mode: int, modes: int) -> int:
@@ -314,11 +385,13 @@ def prob_orbit_mc(graph: nx.Graph, orbit: list, n_mean: float = 5, samples: int
     eng = sf.LocalEngine(backend="gaussian")
     result = eng.run(p)
 
+    # draws often coincide, so the probability of each distinct sample is only computed once
+    sample_counts = Counter(tuple(orbit_to_sample(orbit, modes)) for _ in range(samples))
+
     prob = 0
 
-    for _ in range(samples):
-        sample = orbit_to_sample(orbit, modes)
-        prob += result.state.fock_prob(sample, cutoff=photons + 1)
+    for sample, count in sample_counts.items():
+        prob += count * result.state.fock_prob(list(sample), cutoff=photons + 1)
 
     prob = prob * orbit_cardinality(orbit, modes) / samples
 
@@ -372,11 +445,15 @@ def prob_event_mc(
     eng = sf.LocalEngine(backend="gaussian")
     result = eng.run(p)
 
+    # draws often coincide, so the probability of each distinct sample is only computed once
+    sample_counts = Counter(
+        tuple(event_to_sample(photon_number, max_count_per_mode, modes)) for _ in range(samples)
+    )
+
     prob = 0
 
-    for _ in range(samples):
-        sample = event_to_sample(photon_number, max_count_per_mode, modes)
-        prob += result.state.fock_prob(sample, cutoff=photon_number + 1)
+    for sample, count in sample_counts.items():
+        prob += count * result.state.fock_prob(list(sample), cutoff=photon_number + 1)
 
     prob = prob * event_cardinality(photon_number, max_count_per_mode, modes) / samples
 
@@ -424,7 +501,13 @@ def feature_vector_sampling(
 
     n_samples = len(samples)
 
-    e = (sample_to_event(s, max_count_per_mode) for s in samples)
-    count = Counter(e)
+    if isinstance(samples, np.ndarray):
+        # tuples of Python ints hash much faster than tuples of NumPy scalars
+        samples = samples.tolist()
+
+    # repeated samples are common, so only find the event of each distinct sample once
+    count = Counter()
+    for s, n in Counter(map(tuple, samples)).items():
+        count[sample_to_event(s, max_count_per_mode)] += n
 
     return [count[p] / n_samples for p in event_photon_numbers]
@@ -484,8 +484,10 @@ class Operation:
         # when it is used again after the new measurement.
 
         original_p = self.p  # store the original parameters
-        # Evaluate the Parameters, restore the originals later:
-        self.p = [x.evaluate() for x in self.p]
+        # no extra dependencies <=> no RegRefTransform parameters, nothing to evaluate
+        if self._extra_deps:
+            # Evaluate the Parameters, restore the originals later:
+            self.p = [x.evaluate() for x in self.p]
 
         # convert RegRefs back to indices for the backend API
         temp = [rr.ind for rr in reg]
@@ -735,8 +737,11 @@ class Gate(Transformation):
         if self.dagger:
             z = -z
         original_p = self.p  # store the original Parameters
-        # evaluate the rest of the Parameters, restore the originals later
-        self.p = [z] + [x.evaluate() for x in self.p[1:]]
+        # no extra dependencies <=> no RegRefTransform parameters, so unless p[0] was
+        # negated above the original Parameters can be used as they are
+        if self._extra_deps or self.dagger:
+            # evaluate the rest of the Parameters, restore the originals later
+            self.p = [z] + [x.evaluate() for x in self.p[1:]]
 
         # convert RegRefs back to indices for the backend API
         temp = [rr.ind for rr in reg]
@@ -105,6 +105,9 @@ except ImportError:
     tf = mock.MagicMock()
     _tf_classes = tuple()
 
+_python_numbers = (int, float, complex)
+"""tuple[type]: exact types of the plain Python numbers accepted as parameters"""
+
 
 def _unwrap(params):
     """Unwrap a parameter sequence.
@@ -141,24 +144,27 @@ class Parameter():
     __array_ufunc__ = None
 
     def __init__(self, x):
-        if isinstance(x, Parameter):
-            raise TypeError('Tried initializing a Parameter using a Parameter.')
-
         #: set[RegRef]: parameter value depends on these RegRefs (if any), it can only be evaluated after the corresponding subsystems have been measured
         self.deps = set()
 
-        # wrap RegRefs in the identity RegRefTransform
-        if isinstance(x, RegRef):
-            x = RegRefTransform(x)
-        elif isinstance(x, (numbers.Number, np.ndarray, _tf_classes, RegRefTransform)):
-            pass
-        else:
-            raise TypeError('Unsupported base object type: ' +
-                            x.__class__.__name__)
+        # Plain Python numbers are by far the most common parameters. Checking the exact type
+        # first lets them skip the isinstance checks below, which are slow for the numbers.Number ABC.
+        if type(x) not in _python_numbers:
+            if isinstance(x, Parameter):
+                raise TypeError('Tried initializing a Parameter using a Parameter.')
+
+            # wrap RegRefs in the identity RegRefTransform
+            if isinstance(x, RegRef):
+                x = RegRefTransform(x)
+            elif isinstance(x, (numbers.Number, np.ndarray, _tf_classes, RegRefTransform)):
+                pass
+            else:
+                raise TypeError('Unsupported base object type: ' +
+                                x.__class__.__name__)
 
-        # add extra dependencies due to RegRefs
-        if isinstance(x, RegRefTransform):
-            self.deps.update(x.regrefs)
+            # add extra dependencies due to RegRefs
+            if isinstance(x, RegRefTransform):
+                self.deps.update(x.regrefs)
         self.x = x  #: parameter value, or reference
 
     def __str__(self):
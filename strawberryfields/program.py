@@ -192,6 +192,9 @@ class Program:
         self.target = None
         #: Program, None: for compiled Programs, this is the original, otherwise None
         self.source = None
+        #: dict[tuple, tuple]: latest compilation result for each target name and set of compilation options,
+        #: stored as (source commands and parameter values, compiled circuit, number of connected components)
+        self._compiled = {}
 
         self.run_options = {}
         """dict[str, Any]: dictionary of default run options, to be passed to the engine upon
@@ -455,6 +458,7 @@ class Program:
         """
         self.lock()
         p = copy.copy(self)  # shares RegRefs with the source
+        p._compiled = {}  # the copy may have a different circuit
         # link to the original source Program
         if self.source is None:
             p.source = self
@@ -476,6 +480,14 @@ class Program:
         :meth:`locking <lock>` of both the compiled program and the original to make sure the
         RegRef state remains consistent.
 
+        Compiling for a named target caches the compiled circuit. Compiling the same circuit
+        again for the same target name and options, e.g., when the same Program is run
+        repeatedly by an engine, reuses it instead of decomposing and optimizing the circuit
+        again. A new compiled Program is returned each time. Changes to the circuit and to the
+        numeric parameter values of its Operations are detected, but Operations with array
+        parameters, e.g., :class:`~.Interferometer`, are never cached since the arrays may be
+        modified in place.
+
         Args:
             target (str, ~strawberryfields.circuitspecs.CircuitSpecs): short name of the target circuit specification, or the specification object itself
 
@@ -488,11 +500,18 @@ class Program:
         Returns:
             Program: compiled program
         """
+        key = None
         if isinstance(target, specs.CircuitSpecs):
             db = target
             target = db.short_name
         elif target in specs.circuit_db:
             db = specs.circuit_db[target]()
+            try:
+                key = (target, frozenset(kwargs.items()))
+                hash(key)
+            except TypeError:
+                # unhashable compilation options, do not cache
+                key = None
         else:
             raise ValueError("Could not find target '{}' in the Strawberry Fields circuit database.".format(target))
 
@@ -505,25 +524,43 @@ class Program:
                     "only supports a {}-mode program".format(modes_total, target, db.modes)
                 )
 
-        seq = db.decompose(self.circuit)
+        # snapshot of the commands and their parameter values, used to detect changes to the
+        # circuit since the previous compilation
+        snapshot = [(cmd, tuple(par.x for par in cmd.op.p)) for cmd in self.circuit]
+        if any(not isinstance(x, (numbers.Number, pu.RegRefTransform)) for _, xs in snapshot for x in xs):
+            # mutable parameter values such as arrays may change in place, do not cache
+            key = None
+
+        # reuse the previous compilation if the circuit has not changed since
+        cached = self._compiled.get(key)
+        hit = cached is not None and cached[0] == snapshot
+        if hit:
+            _, seq, num_components = cached
+        else:
+            seq = db.decompose(self.circuit)
+            num_components = None
+            if kwargs.get('warn_connected', True):
+                DAG = pu.list_to_DAG(seq)
+                num_components = nx.algorithms.components.number_weakly_connected_components(DAG)
+
+        if num_components is not None and num_components > 1:
+            warnings.warn('The circuit consists of {} disconnected components.'.format(num_components))
 
-        if kwargs.get('warn_connected', True):
-            DAG = pu.list_to_DAG(seq)
-            temp = nx.algorithms.components.number_weakly_connected_components(DAG)
-            if temp > 1:
-                warnings.warn('The circuit consists of {} disconnected components.'.format(temp))
+        if not hit:
+            # run optimizations
+            if kwargs.get('optimize', False):
+                seq = pu.optimize_circuit(seq)
 
-        # run optimizations
-        if kwargs.get('optimize', False):
-            seq = pu.optimize_circuit(seq)
+            # does the circuit spec  have its own compilation method?
+            if db.compile is not None:
+                seq = db.compile(seq, self.register)
 
-        # does the circuit spec  have its own compilation method?
-        if db.compile is not None:
-            seq = db.compile(seq, self.register)
+            if key is not None:
+                self._compiled[key] = (snapshot, seq, num_components)
 
         # create the compiled Program
         compiled = self._linked_copy()
-        compiled.circuit = seq
+        compiled.circuit = list(seq)
         compiled.target = target
 
         # get run options of compiled program
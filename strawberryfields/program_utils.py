@@ -210,7 +210,7 @@ class RegRefTransform:
         if isinstance(refs, RegRef):
             refs = [refs]
 
-        if any([not r.active for r in refs]):
+        if any(not r.active for r in refs):
             # todo allow this if the regref already has a measurement result in it.
             # Maybe we want to delete a mode after measurement to save comp effort.
             raise ValueError('Trying to use inactive RegRefs.')
@@ -252,13 +252,18 @@ class RegRefTransform:
         Returns:
             Number: function value
         """
+        if self.func is None:
+            # identity transformation, return the measured value as is
+            val = self.regrefs[0].val
+            if val is None:
+                raise CircuitError("Trying to use a nonexistent measurement result (e.g., before it has been measured).")
+            return val
+
         temp = [r.val for r in self.regrefs]
         if any(v is None for v in temp):
             # NOTE: "if None in temp" causes an error if temp contains arrays,
             # since it uses the == comparison in addition to "is"
             raise CircuitError("Trying to use a nonexistent measurement result (e.g., before it has been measured).")
-        if self.func is None:
-            return temp[0]
         return self.func(*temp)
 
 
@@ -326,6 +326,102 @@ class TestValidation:
         with pytest.warns(UserWarning, match='The circuit consists of 2 disconnected components.'):
             new_prog = prog.compile(target='fock')
 
+    def test_compiled_program_cached(self, monkeypatch):
+        """Test that compiling a program again for the same target and options
+        reuses the cached compiled circuit, but returns a new compiled program."""
+        prog = sf.Program(2)
+        with prog.context as q:
+            ops.S2gate(0.6) | q
+            ops.MeasureFock() | q
+
+        new_prog = prog.compile(target='fock')
+
+        with monkeypatch.context() as m:
+            # the circuit must not be decomposed again
+            m.setattr(CircuitSpecs, "decompose", lambda *args: pytest.fail("circuit recompiled"))
+            again = prog.compile(target='fock')
+
+        assert again is not new_prog
+        assert again.circuit == new_prog.circuit
+        assert again.circuit is not new_prog.circuit
+
+        # different options or targets are compiled separately
+        assert len(prog.compile(target='fock', optimize=True)) == len(new_prog)
+        assert prog.compile(target='gaussian').target == 'gaussian'
+        assert len(prog._compiled) == 3
+
+        # changing the circuit invalidates the cached compiled circuit, and replaces it
+        prog.locked = False
+        with prog.context as q:
+            ops.Dgate(0.1) | q[0]
+        assert len(prog.compile(target='fock')) == len(new_prog) + 1
+        assert len(prog._compiled) == 3
+
+    def test_compiled_program_cached_parameter_change(self):
+        """Test that the compiled program reflects parameter values changed in place
+        after a previous compilation."""
+
+        def rotation(theta):
+            return np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
+
+        def compiled_ops(*gates):
+            prog = sf.Program(2)
+            with prog.context as q:
+                for G in gates:
+                    G | q
+            return [str(cmd) for cmd in prog.compile(target='fock').circuit]
+
+        # changed numeric parameters are detected
+        prog = sf.Program(2)
+        with prog.context as q:
+            ops.S2gate(0.6) | q
+
+        before = [str(cmd) for cmd in prog.compile(target='fock').circuit]
+        prog.circuit[0].op.p[0] = sf.parameters.Parameter(0.3)
+        after = [str(cmd) for cmd in prog.compile(target='fock').circuit]
+
+        assert after != before
+        assert after == compiled_ops(ops.S2gate(0.3))
+
+        # array parameters may be modified in place, and are not cached
+        U = rotation(0.1)
+        prog = sf.Program(2)
+        with prog.context as q:
+            ops.Interferometer(U) | q
+
+        before = [str(cmd) for cmd in prog.compile(target='fock').circuit]
+        U[:] = rotation(0.7)
+        after = [str(cmd) for cmd in prog.compile(target='fock').circuit]
+
+        assert not prog._compiled
+        assert after != before
+        assert after == compiled_ops(ops.Interferometer(rotation(0.7)))
+
+    def test_compiled_program_cached_disconnected(self):
+        """Test that the disconnected circuit warning is also raised when the
+        cached compiled circuit is reused."""
+        prog = sf.Program(2)
+        with prog.context as q:
+            ops.Dgate(1.0) | q[0]
+            ops.Dgate(1.0) | q[1]
+
+        for _ in range(2):
+            with pytest.warns(UserWarning, match='The circuit consists of 2 disconnected components.'):
+                prog.compile(target='fock')
+
+    def test_compiled_program_cached_engine_runs(self):
+        """Test that repeated engine runs of the same program store distinct
+        compiled programs."""
+        prog = sf.Program(1)
+        with prog.context as q:
+            ops.Dgate(0.1) | q[0]
+
+        eng = sf.LocalEngine("gaussian")
+        eng.run(prog)
+        eng.run(prog)
+        assert eng.run_progs[0] is not eng.run_progs[1]
+        assert eng.run_progs[0].circuit == eng.run_progs[1].circuit
+
     def test_incorrect_modes(self):
         """Test that an exception is raised if the circuit spec
         is called with the incorrect number of modes"""
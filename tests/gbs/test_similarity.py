@@ -16,7 +16,6 @@ Unit tests for strawberryfields.gbs.similarity
 """
 # pylint: disable=no-self-use,unused-argument,too-many-arguments
 import itertools
-from collections import Counter
 
 import networkx as nx
 import numpy as np
@@ -34,6 +33,24 @@ all_orbits = {
 
 all_orbits_cumulative = [o for orbs in all_orbits.values() for o in orbs]
 
+all_orbits_zeros = [
+    [1, 1, 1, 0, 0],
+    [2, 1, 0, 0, 0],
+    [3, 0, 0, 0, 0],
+    [1, 1, 1, 1, 0],
+    [2, 1, 1, 0, 0],
+    [3, 1, 0, 0, 0],
+    [2, 2, 0, 0, 0],
+    [4, 0, 0, 0, 0],
+    [1, 1, 1, 1, 1],
+    [2, 1, 1, 1, 0],
+    [3, 1, 1, 0, 0],
+    [2, 2, 1, 0, 0],
+    [4, 1, 0, 0, 0],
+    [3, 2, 0, 0, 0],
+    [5, 0, 0, 0, 0],
+]  # all_orbits_cumulative padded with zeros at the end for comparison to samples
+
 all_events = {
     (3, 1): [3, None, None],
     (4, 1): [4, None, None, None, None],
@@ -52,15 +69,23 @@ def test_sample_to_orbit(dim):
     orb = all_orbits[dim]
     checks = []
     for o in orb:
-        sorted_sample = o.copy()
-        sorted_sample_len = len(sorted_sample)
-        if sorted_sample_len != dim:
-            sorted_sample += [0] * sorted_sample_len
-        permutations = itertools.permutations(sorted_sample)
+        sorted_sample = o
+        if len(o) != dim:
+            sorted_sample = o + [0] * len(o)
+        # sample_to_orbit only depends on the multiset of counts, so skip repeated permutations
+        permutations = set(itertools.permutations(sorted_sample))
         checks.append(all([similarity.sample_to_orbit(p) == o for p in permutations]))
     assert all(checks)
 
 
+def test_sample_to_orbit_array():
+    """Test if function ``similarity.sample_to_orbit`` returns the orbit as a list of Python
+    integers when the input sample is a NumPy array."""
+    orb = similarity.sample_to_orbit(np.array([1, 2, 0, 0, 1, 1, 0, 3]))
+    assert orb == [3, 2, 1, 1, 1]
+    assert all(isinstance(o, int) for o in orb)
+
+
 @pytest.mark.parametrize("dim", [3, 4, 5])
 class TestOrbits:
     """Tests for the function ``strawberryfields.gbs.similarity.orbits``"""
@@ -120,28 +145,15 @@ class TestOrbitToSample:
         sample and comparing to a count of elements in the orbit."""
         modes = 5
 
-        all_orbits_zeros = [
-            [1, 1, 1, 0, 0],
-            [2, 1, 0, 0, 0],
-            [3, 0, 0, 0, 0],
-            [1, 1, 1, 1, 0],
-            [2, 1, 1, 0, 0],
-            [3, 1, 0, 0, 0],
-            [2, 2, 0, 0, 0],
-            [4, 0, 0, 0, 0],
-            [1, 1, 1, 1, 1],
-            [2, 1, 1, 1, 0],
-            [3, 1, 1, 0, 0],
-            [2, 2, 1, 0, 0],
-            [4, 1, 0, 0, 0],
-            [3, 2, 0, 0, 0],
-            [5, 0, 0, 0, 0],
-        ]  # padding orbits with zeros at the end for comparison to samples
-
-        counts = [Counter(similarity.orbit_to_sample(o, modes)) for o in all_orbits_cumulative]
-        ideal_counts = [Counter(o) for o in all_orbits_zeros]
-
-        assert counts == ideal_counts
+        max_photon = 5
+
+        counts = [
+            np.bincount(similarity.orbit_to_sample(o, modes), minlength=max_photon + 1)
+            for o in all_orbits_cumulative
+        ]
+        ideal_counts = [np.bincount(o, minlength=max_photon + 1) for o in all_orbits_zeros]
+
+        assert np.array_equal(counts, ideal_counts)
 
 
 class TestEventToSample:
@@ -183,19 +195,59 @@ class TestEventToSample:
         samp = similarity.event_to_sample(photon_num, count, modes_dim)
         assert max(samp) <= count
 
+    @pytest.mark.parametrize("modes_dim", [0, 3])
+    def test_zero_photons(self, modes_dim):
+        """Test if function returns the vacuum sample when there are no photons."""
+        assert similarity.event_to_sample(0, 0, modes_dim) == [0] * modes_dim
+
     @pytest.mark.parametrize("photon_num", [5, 6])
-    @pytest.mark.parametrize("count", [3, 4])
-    def test_sample_max_count_deterministic(self, photon_num, count, monkeypatch):
-        """Test if function correctly stops adding photons to modes who have reached their
-        maximum count. This test ensures that the maximum count is exceeded in each case by
-        setting ``photon_num > count`` and monkeypatching the random choice to always pick the
-        first element of a list. This should cause the first mode to fill up with ``count``
-        photons."""
+    def test_sample_max_count_constrained(self, photon_num, monkeypatch):
+        """Test if function returns a valid sample for a tightly constrained event. Since most
+        stars and bars draws would be rejected, the function must fill the modes one at a time
+        without drawing stars and bars, which is checked by monkeypatching the random choice to
+        raise an error."""
         modes_dim = 10
+
+        def choice(*args, **kwargs):
+            raise AssertionError("stars and bars draw for a constrained event")
+
         with monkeypatch.context() as m:
-            m.setattr("numpy.random.choice", lambda x: x[0])
-            samp = similarity.event_to_sample(photon_num, count, modes_dim)
-        assert samp[0] == count
+            m.setattr("numpy.random.choice", choice)
+            samp = similarity.event_to_sample(photon_num, 1, modes_dim)
+        assert len(samp) == modes_dim
+        assert sum(samp) == photon_num
+        assert max(samp) <= 1
+
+    @pytest.mark.parametrize(
+        "count, samples, stars_and_bars",
+        [
+            (3, [[3, 1, 0], [2, 2, 0], [2, 1, 1]], True),
+            (2, [[2, 2, 0], [2, 1, 1]], False),
+        ],
+    )
+    def test_uniform(self, count, samples, stars_and_bars, monkeypatch):
+        """Test if function samples uniformly among all samples in the event, both when drawing
+        with stars and bars and when filling the modes one at a time. The events have 4 photons
+        in 3 modes and consist of all permutations of ``samples``."""
+        np.random.seed(1967)
+        n_samples = 6000
+        draws = []
+        choice = np.random.choice
+
+        def spy(*args, **kwargs):
+            draws.append(args)
+            return choice(*args, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setattr("numpy.random.choice", spy)
+            samps = [tuple(similarity.event_to_sample(4, count, 3)) for _ in range(n_samples)]
+
+        expected = set(itertools.chain(*[itertools.permutations(s) for s in samples]))
+        freqs = {s: samps.count(s) / n_samples for s in set(samps)}
+
+        assert bool(draws) == stars_and_bars
+        assert set(freqs) == expected
+        assert np.allclose(list(freqs.values()), 1 / len(expected), atol=0.03)
 
 
 orbits = [